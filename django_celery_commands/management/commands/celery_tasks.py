@@ -1,8 +1,165 @@
+import functools
 import inspect
 from typing import get_type_hints, get_origin, get_args
 from django.core.management.base import BaseCommand, CommandError
 from celery import current_app
 
+try:
+    from typing import Annotated
+except ImportError:  # Python < 3.9
+    Annotated = None
+
+
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+_BOOL_FALSE = frozenset({"false", "0", "no", "off"})
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except ValueError as e:
+        raise CommandError(f"Cannot cast '{value}' to int: {e}")
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except ValueError as e:
+        raise CommandError(f"Cannot cast '{value}' to float: {e}")
+
+
+def _to_bool(value):
+    # Accept common variants for boolean
+    lower_val = value.lower()
+    if lower_val in _BOOL_TRUE:
+        return True
+    if lower_val in _BOOL_FALSE:
+        return False
+    raise CommandError(f"Cannot cast '{value}' to bool (expected true/false, yes/no, on/off or 1/0).")
+
+
+def _to_str(value):
+    return value
+
+
+# Scalar annotation -> caster
+_CASTERS = {
+    str: _to_str,
+    int: _to_int,
+    float: _to_float,
+    bool: _to_bool,
+}
+
+
+def _get_celery_tasks(include_internal=False):
+    """
+    Return the Celery task registry as {task_name: task_obj}.
+    Celery's own built-in tasks (celery.chord, celery.backend_cleanup, ...) are
+    left out unless 'include_internal' is set.
+    """
+    tasks = current_app.tasks
+    if include_internal:
+        return dict(tasks)
+    return {name: task for name, task in tasks.items() if not name.startswith("celery.")}
+
+
+def _compile_caster(annotation):
+    """
+    Return a function that casts a raw string to the type given by 'annotation'.
+    Resolved once per annotation, so casting a value is a single call.
+    """
+    if annotation is None:
+        # No type hint => treat as raw string
+        return _to_str
+
+    # Annotated[int, ...] => cast as int, like get_type_hints() does
+    if Annotated is not None and get_origin(annotation) is Annotated:
+        return _compile_caster(get_args(annotation)[0])
+
+    # Basic built-ins: a single dict lookup instead of a chain of comparisons
+    # (only for classes, other annotations may not be hashable)
+    if isinstance(annotation, type):
+        caster = _CASTERS.get(annotation)
+        if caster is not None:
+            return caster
+
+    # e.g. annotation could be List[int], Union, etc.
+    origin = get_origin(annotation)  # e.g. list, Union, etc.
+    args = get_args(annotation)      # e.g. (int,) if it's List[int]
+
+    # Example for a List[...] type
+    if origin is list and args:
+        # We'll assume a comma-separated list for this example, e.g. "1,2,3"
+        item_caster = _compile_caster(args[0])  # e.g. int if annotation is List[int]
+
+        def _to_list(value):
+            return [item_caster(item.strip()) for item in value.split(",")]
+
+        return _to_list
+
+    # If we get here, it's a more complex type we haven't explicitly handled
+    # or a generic "list" with no sub-type. Return the string or raise an error.
+    # For advanced usage, consider using pydantic or your own logic for e.g. Union, Dict, etc.
+    return _to_str
+
+
+def _positional_params(func):
+    """
+    Return (positional param names in order, name of the *args param or None) for 'func'.
+    Reads them straight from the code object; inspect.signature() is only used for
+    callables without one (builtins, wrapped/partial objects).
+    """
+    bound_self = getattr(func, "__self__", None)
+    plain_func = getattr(func, "__func__", func)
+    code = getattr(plain_func, "__code__", None)
+    if code is None or hasattr(plain_func, "__wrapped__"):
+        names = []
+        varargs_name = None
+        for param in inspect.signature(func).parameters.values():
+            if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                names.append(param.name)
+            elif param.kind == param.VAR_POSITIONAL:
+                varargs_name = param.name
+        return tuple(names), varargs_name
+
+    names = code.co_varnames[:code.co_argcount]
+    varargs_name = None
+    if code.co_flags & inspect.CO_VARARGS:
+        varargs_name = code.co_varnames[code.co_argcount + code.co_kwonlyargcount]
+    if bound_self is not None and plain_func is not func:
+        # Bound method (e.g. bind=True or class-based tasks): drop 'self'
+        names = names[1:]
+    return names, varargs_name
+
+
+def _get_type_hints(func):
+    """
+    Return the annotations of 'func' as a {param_name: type} dict.
+    Annotations are usually real types already, so we read them directly and only
+    fall back to get_type_hints() (which evals every annotation) for string ones.
+    """
+    raw = getattr(func, "__annotations__", None) or {}
+    if any(isinstance(v, str) for v in raw.values()):
+        return get_type_hints(func)
+    return raw
+
+
+@functools.lru_cache(maxsize=None)
+def _task_meta(task):
+    """
+    Introspect task.run once and return
+    (positional param names, *args param name or None, {param_name: caster}).
+    Cached per task object, so repeated call_command("celery_tasks", ...) calls
+    in the same process skip the introspection.
+    """
+    func = task.run
+    casters = {
+        name: _compile_caster(annotation)
+        for name, annotation in _get_type_hints(func).items()
+    }
+    param_names, varargs_name = _positional_params(func)
+    return param_names, varargs_name, casters
+
 
 class Command(BaseCommand):
     help = "Call Celery tasks by name, with advanced type parsing from function annotations."
@@ -37,15 +194,16 @@ class Command(BaseCommand):
         self.run_task(task_name, options)
 
     def list_all_tasks(self):
-        tasks = current_app.tasks  # dict of {task_name: task_obj}
-        task_names = sorted(tasks.keys())
-        self.stdout.write("Celery Task Registry:\n")
-        for name in task_names:
-            self.stdout.write(f"  {name}")
-        self.stdout.write(
-            "\nUsage: python manage.py celery_tasks <task_name> "
+        tasks = _get_celery_tasks()  # dict of {task_name: task_obj}
+        # Build the whole listing and write it in one go
+        lines = ["Celery Task Registry:"]
+        lines.extend(f"  {name}" for name in sorted(tasks))
+        lines.append("")
+        lines.append(
+            "Usage: python manage.py celery_tasks <task_name> "
             "[--args X Y] [--kwargs foo=bar]"
         )
+        self.stdout.write("\n".join(lines))
 
     def run_task(self, task_name, options):
         tasks = current_app.tasks
@@ -56,10 +214,8 @@ class Command(BaseCommand):
         if not hasattr(task, "run"):
             raise CommandError(f"Task '{task_name}' has no .run method?")
 
-        # Introspect the .run() method to get signature and type hints
-        func = task.run
-        signature = inspect.signature(func)
-        type_hints = get_type_hints(func)  # {param_name: type, ...}
+        # Introspect the .run() method to get parameter names and per-parameter casters
+        param_names, varargs_name, casters = _task_meta(task)  # casters: {param_name: caster, ...}
 
         # Parse the user-provided arguments
         positional_args_raw = options["args"] or []
@@ -69,28 +225,23 @@ class Command(BaseCommand):
         final_args = []
         final_kwargs = {}
 
-        # Get the parameter list in order for positional arguments
-        sig_params = list(signature.parameters.values())  # e.g. [<Param "a">, <Param "b=...">, ...]
         # 1) Handle positional arguments
         for i, raw_value in enumerate(positional_args_raw):
-            if i >= len(sig_params):
-                # The user passed more positional args than the function expects
-                final_args.append(raw_value)
-                continue
-            param = sig_params[i]
-            param_name = param.name
-            param_type = type_hints.get(param_name, None)
-            cast_value = self._cast_value(raw_value, param_type)
-            final_args.append(cast_value)
+            if i < len(param_names):
+                param_name = param_names[i]
+            else:
+                # Extra values go to *args (cast with its annotation), or are passed raw
+                param_name = varargs_name
+            cast = casters.get(param_name, _to_str)
+            final_args.append(cast(raw_value))
 
         # 2) Handle keyword arguments
         for raw_kv in kwargs_raw:
-            if "=" not in raw_kv:
+            k, sep, v = raw_kv.partition("=")
+            if not sep:
                 raise CommandError("Invalid --kwargs format. Must be key=value.")
-            k, v = raw_kv.split("=", 1)
-            param_type = type_hints.get(k, None)
-            cast_value = self._cast_value(v, param_type)
-            final_kwargs[k] = cast_value
+            cast = casters.get(k, _to_str)
+            final_kwargs[k] = cast(v)
 
         # Fire the task asynchronously
         result = task.delay(*final_args, **final_kwargs)
@@ -99,56 +250,3 @@ class Command(BaseCommand):
                 f"Task '{task_name}' called. Task ID: {result.id}"
             )
         )
-
-    def _cast_value(self, value: str, annotation):
-        """
-        Attempt to cast the string 'value' to the Python type given by 'annotation'.
-        If no annotation is provided, or if casting fails, we just return the original string
-        (or raise an error if that is appropriate).
-        """
-        if annotation is None:
-            # No type hint => treat as raw string
-            return value
-
-        # e.g. annotation could be int, bool, float, str, or something more complex
-        origin = get_origin(annotation)  # e.g. list, Union, etc.
-        args = get_args(annotation)      # e.g. (int,) if it's List[int]
-
-        # Basic built-ins
-        if annotation == str:
-            return value
-        elif annotation == int:
-            try:
-                return int(value)
-            except ValueError as e:
-                raise CommandError(f"Cannot cast '{value}' to int: {e}")
-        elif annotation == float:
-            try:
-                return float(value)
-            except ValueError as e:
-                raise CommandError(f"Cannot cast '{value}' to float: {e}")
-        elif annotation == bool:
-            # Accept common variants for boolean
-            lower_val = value.lower()
-            if lower_val in ["true", "1", "yes"]:
-                return True
-            elif lower_val in ["false", "0", "no"]:
-                return False
-            else:
-                raise CommandError(f"Cannot cast '{value}' to bool (expected true/false/1/0).")
-
-        # Example for a List[...] type
-        if origin == list and args:
-            # We'll assume a comma-separated list for this example, e.g. "1,2,3"
-            inner_type = args[0]  # e.g. int if annotation is List[int]
-            items = value.split(",")
-
-            casted_items = []
-            for item in items:
-                casted_items.append(self._cast_value(item.strip(), inner_type))
-            return casted_items
-
-        # If we get here, it's a more complex type we haven't explicitly handled
-        # or a generic "list" with no sub-type. Return the string or raise an error.
-        # For advanced usage, consider using pydantic or your own logic for e.g. Union, Dict, etc.
-        return value
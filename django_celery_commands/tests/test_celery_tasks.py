@@ -0,0 +1,115 @@
+import functools
+import unittest
+from io import StringIO
+from typing import List
+from unittest import mock
+
+from celery import Celery, Task
+from django.core.management.base import CommandError
+
+from django_celery_commands.management.commands import celery_tasks
+from django_celery_commands.management.commands.celery_tasks import (
+    Command,
+    _compile_caster,
+    _positional_params,
+)
+
+
+class CompileCasterTests(unittest.TestCase):
+    def test_scalars(self):
+        self.assertEqual(_compile_caster(int)("5"), 5)
+        self.assertEqual(_compile_caster(float)("1.5"), 1.5)
+        self.assertEqual(_compile_caster(str)("abc"), "abc")
+
+    def test_no_annotation_returns_raw_string(self):
+        self.assertEqual(_compile_caster(None)("5"), "5")
+
+    def test_invalid_scalar_raises_command_error(self):
+        with self.assertRaises(CommandError):
+            _compile_caster(int)("five")
+
+    def test_bool_variants(self):
+        cast = _compile_caster(bool)
+        for value in ["true", "TRUE", "1", "yes", "on"]:
+            self.assertIs(cast(value), True)
+        for value in ["false", "False", "0", "no", "off"]:
+            self.assertIs(cast(value), False)
+        with self.assertRaises(CommandError):
+            cast("maybe")
+
+    def test_list_of_int(self):
+        self.assertEqual(_compile_caster(List[int])("1, 2,3"), [1, 2, 3])
+
+    def test_unknown_type_returns_raw_string(self):
+        self.assertEqual(_compile_caster(dict)("a=1"), "a=1")
+        self.assertEqual(_compile_caster([int])("5"), "5")
+
+
+class PositionalParamsTests(unittest.TestCase):
+    def test_plain_function(self):
+        def run(a, b=1, *rest, c=2, **kwargs):
+            pass
+
+        self.assertEqual(_positional_params(run), (("a", "b"), "rest"))
+
+    def test_bound_task(self):
+        app = Celery(set_as_current=False)
+
+        @app.task(bind=True)
+        def bound(self, a, b):
+            pass
+
+        self.assertEqual(_positional_params(bound.run), (("a", "b"), None))
+
+    def test_class_based_task(self):
+        class MyTask(Task):
+            def run(self, a, *ids):
+                pass
+
+        self.assertEqual(_positional_params(MyTask().run), (("a",), "ids"))
+
+    def test_wrapped_function(self):
+        def run(a, b):
+            pass
+
+        @functools.wraps(run)
+        def wrapper(*args, **kwargs):
+            return run(*args, **kwargs)
+
+        self.assertEqual(_positional_params(wrapper), (("a", "b"), None))
+
+
+class RunTaskTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Celery(set_as_current=False)
+
+        @self.app.task(name="tests.add")
+        def add(a: int, *rest: int, label: str = "", ratio: float = 1.0):
+            pass
+
+        self.task = add
+        patcher = mock.patch.object(celery_tasks, "current_app", self.app)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_task(self, args=None, kwargs=None):
+        command = Command(stdout=StringIO())
+        with mock.patch.object(self.task, "delay") as delay:
+            command.run_task("tests.add", {"args": args, "kwargs": kwargs})
+        return delay
+
+    def test_args_are_cast(self):
+        delay = self.run_task(args=["1", "2", "3"])
+        delay.assert_called_once_with(1, 2, 3)
+
+    def test_kwargs_value_containing_equals(self):
+        delay = self.run_task(kwargs=["label=a=b", "ratio=0.5"])
+        delay.assert_called_once_with(label="a=b", ratio=0.5)
+
+    def test_kwargs_without_equals_raises(self):
+        with self.assertRaises(CommandError):
+            self.run_task(kwargs=["label"])
+
+    def test_unknown_task_raises(self):
+        with self.assertRaises(CommandError):
+            Command(stdout=StringIO()).run_task("tests.missing", {"args": None, "kwargs": None})